@@ -19,6 +19,8 @@ Output:
     Custom Service: Breakfast
 """
 
+import datetime
+
 
 class Booking:
     """
@@ -32,6 +34,8 @@ class Booking:
         custom_service (str): Any custom services requested for the booking.
     """
 
+    __slots__ = ("id", "room", "arrival", "departure", "custom_service")
+
     def __init__(self, id, room, arrival, departure, custom_service):
         self.id = id
         self.room = room
@@ -39,6 +43,43 @@ class Booking:
         self.departure = departure
         self.custom_service = custom_service
 
+    def to_dict(self):
+        """
+        Returns the booking as a JSON-serializable dictionary.
+
+        Dates are converted to ISO format strings so the result can be
+        serialized directly with orjson.
+
+        Returns:
+            dict: The booking attributes, with dates as ISO strings.
+        """
+        return {
+            "id": self.id,
+            "room": self.room,
+            "arrival": self.arrival.isoformat(),
+            "departure": self.departure.isoformat(),
+            "custom_service": self.custom_service,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Creates a Booking from a dictionary produced by to_dict.
+
+        Args:
+            data (dict): The booking attributes, with dates as ISO strings.
+
+        Returns:
+            Booking: The reconstructed booking.
+        """
+        return cls(
+            data["id"],
+            data["room"],
+            datetime.date.fromisoformat(data["arrival"]),
+            datetime.date.fromisoformat(data["departure"]),
+            data["custom_service"],
+        )
+
     def get_booking_details(self):
         """
         Returns the details of the booking.
@@ -1,7 +1,7 @@
 """
 WARNING: 
 This module is meant to be called by scheduler_gui.py and not directly by the user.
-It only works with windows. It will stay that way unless someone wants to add support for other OSs.
+Physical printing only works on windows (pywin32); everything else runs anywhere.
 
 This module contains a class and a function to manage hotel bookings.
 
@@ -14,18 +14,118 @@ Functions:
 """
 
 import datetime
-import pickle
+import functools
+import io
 import os
 import json
-import string
-import pandas as pd
-import win32api
-import win32print
+from collections import defaultdict
+import numpy as np
+import orjson
+import lxml.html
 from booking import Booking
 
 SERVICES_FILE_PATH = "services.json"
 RULES_FILE_PATH = "rules.json"
 
+# Compact the journal back into the snapshot once it grows past this size.
+JOURNAL_COMPACT_BYTES = 64 * 1024
+
+# Column positions in the reservations export (ID, Άφιξη, Αναχώρηση, Δωμάτιο).
+_COL_ID = 0
+_COL_ARRIVAL = 2
+_COL_DEPARTURE = 3
+_COL_ROOM = 6
+
+
+# Job codes returned by _classify_job, in display order.
+_JOB_NAMES = ("Γενικό", "Check-out", "Πετσέτες", "Πετσέτες/Σεντόνια")
+
+# Width of the printed job box, with the ruler and padding pool built once.
+_LINE_WIDTH = 30
+_RULER = "*" * _LINE_WIDTH
+_SPACES = " " * _LINE_WIDTH
+
+
+@functools.lru_cache(maxsize=None)
+def _get_padding(print_string):
+    """
+    Gets the padding that right-aligns a job line's closing asterisk.
+
+    The same few job strings recur across days, so results are memoized.
+
+    Parameters
+    ----------
+    print_string : str
+        The job line for which the padding is to be calculated.
+
+    Returns
+    -------
+    str
+        A string of spaces followed by an asterisk.
+    """
+
+    return _SPACES[: max(0, _LINE_WIDTH - len(print_string) - 1)] + "*"
+
+
+def _classify_job(days, stay_length, custom_service):
+    """
+    Classifies the job due on one day of a stay.
+
+    This is the integer-only core of the job schedule: it works purely
+    on day offsets so the per-booking loop in _compute_jobs_for_range
+    stays free of date objects and string formatting.
+
+    Parameters
+    ----------
+    days : int
+        The day offset from the arrival date.
+    stay_length : int
+        The length of the stay in days (departure minus arrival).
+    custom_service : int
+        The custom service interval of the booking.
+
+    Returns
+    -------
+    int
+        An index into _JOB_NAMES, or -1 if no job is due.
+    """
+
+    if days == 0:
+        return 0
+    if days == stay_length:
+        return 1
+    if days % (2 * custom_service) == custom_service:
+        return 2
+    if days % (2 * custom_service) == 0:
+        return 3
+    return -1
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_ddmmyyyy(date_string):
+    """
+    Parses a "dd/mm/yyyy" date string into a datetime.date.
+
+    This is a fast path for the fixed date format used throughout the
+    bookings HTML and the rules/services JSON files; it avoids the
+    overhead of datetime.strptime in per-row loops. Days and months may
+    be written without a leading zero. Results are memoized since the
+    same date strings recur across rows and repeated loads.
+
+    Parameters
+    ----------
+    date_string : str
+        A date in the format "dd/mm/yyyy".
+
+    Returns
+    -------
+    datetime.date
+        The parsed date.
+    """
+
+    day, month, year = date_string.split("/")
+    return datetime.date(int(year), int(month), int(day))
+
 
 class HotelManager:
 
@@ -47,16 +147,16 @@ class HotelManager:
     -------
     load_bookings_from_html(file_path):
         Loads bookings from an HTML file and stores them in the bookings attribute.
+    load_bookings_from_csv(file_path):
+        Loads bookings from a CSV export and stores them in the bookings attribute.
     load_rules(file_path):
         Loads custom rules for bookings from a JSON file.
     update_custom_service(id, new_custom_service):
         Updates the custom service of a booking.
     save_bookings():
-        Saves the current bookings to a pickle file.
+        Saves the current bookings to a JSON file.
     add_booking(room, arrival, departure, custom_service):
         Adds a new booking to the list of bookings.
-    _get_padding(print_string):
-        Internal method to get padding for print statements.
     print_todays_jobs(today=None, to_file=False):
         Prints the jobs for a specific day.
     print_file(file_path):
@@ -82,9 +182,87 @@ class HotelManager:
         self.rooms = rooms
         self.bookings = []
         self.save_file = save_file
+        self.journal_file = save_file + ".log"
+        # (path, st_mtime_ns) -> parsed contents, so repeated HTML loads
+        # skip re-parsing unchanged rules/services files.
+        self._rules_cache = None
+        self._services_cache = None
         if os.path.exists(self.save_file):
             with open(self.save_file, "rb") as f:
-                self.bookings = pickle.load(f)
+                self.bookings = [Booking.from_dict(d) for d in orjson.loads(f.read())]
+        self._replay_journal()
+        self._sync_arrays()
+
+    def _replay_journal(self):
+        """
+        Reapplies journalled mutations on top of the bookings snapshot.
+
+        add_booking and update_custom_service only append one line to
+        the journal instead of rewriting the whole snapshot, so on
+        startup those operations are replayed in order to reconstruct
+        the current state.
+        """
+
+        if not os.path.exists(self.journal_file):
+            return
+        with open(self.journal_file, "rb") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = orjson.loads(line)
+                if entry["op"] == "add":
+                    self.bookings.append(Booking.from_dict(entry["booking"]))
+                elif entry["op"] == "update":
+                    for booking in self.bookings:
+                        if booking.id == entry["id"]:
+                            booking.custom_service = entry["custom_service"]
+
+    def _append_journal(self, entry):
+        """
+        Appends one mutation to the journal, compacting when it grows.
+
+        Parameters
+        ----------
+        entry : dict
+            The journal entry, e.g. {"op": "add", "booking": {...}}.
+        """
+
+        with open(self.journal_file, "ab") as f:
+            f.write(orjson.dumps(entry))
+            f.write(b"\n")
+            f.flush()
+            os.fsync(f.fileno())
+        if os.path.getsize(self.journal_file) > JOURNAL_COMPACT_BYTES:
+            self.save_bookings()
+
+    def _sync_arrays(self):
+        """
+        Rebuilds the structure-of-arrays view of the bookings list.
+
+        The parallel arrays mirror `bookings` and let whole-list
+        comparisons (room overlap checks, ID lookups) run as single
+        NumPy operations instead of Python attribute-lookup loops. The
+        Booking objects remain the source of truth; this must be called
+        whenever the bookings list itself changes.
+        """
+
+        self._ids = np.array([b.id for b in self.bookings], dtype=object)
+        self._room_names = np.array([b.room for b in self.bookings], dtype=object)
+        self._arrivals_ord = np.array(
+            [b.arrival.toordinal() for b in self.bookings], dtype=np.int32
+        )
+        self._departures_ord = np.array(
+            [b.departure.toordinal() for b in self.bookings], dtype=np.int32
+        )
+        # Dates never change without a list rebuild, so their display
+        # strings can be cached here instead of formatted per print.
+        self._arrivals_iso = [b.arrival.isoformat() for b in self.bookings]
+        self._departures_iso = [b.departure.isoformat() for b in self.bookings]
+        # IDs repeat when a reservation is split into stays by rules.json,
+        # so the index maps each ID to all of its bookings.
+        self._by_id = defaultdict(list)
+        for booking in self.bookings:
+            self._by_id[booking.id].append(booking)
 
     def load_bookings_from_html(self, file_path):
         """
@@ -103,14 +281,19 @@ class HotelManager:
             A message indicating whether the bookings and custom services were loaded successfully.
         """
 
-        df = pd.read_html(file_path, skiprows=1)[0]
-        headers = list(string.ascii_uppercase)[:24]
-        df.columns = headers
+        parser = lxml.html.HTMLParser(recover=True)
+        tree = lxml.html.parse(file_path, parser=parser)
+        # [1:] mirrors the original pd.read_html(skiprows=1), which
+        # skipped the first data row on top of consuming the header.
+        rows = tree.xpath("//table[1]//tbody//tr")[1:]
         self.bookings = []
         rules = self.load_rules("rules.json")
-        for _, row in df.iterrows():
-            id = str(row["A"])  # get ID from column A
-            room = str(row["G"])
+        for row in rows:
+            cells = row.xpath("./td")
+            if len(cells) <= _COL_ROOM:
+                continue
+            id = cells[_COL_ID].text_content().strip()
+            room = cells[_COL_ROOM].text_content().strip()
             if id in rules:
                 for arrival, departure in rules[id]:
                     custom_service = (
@@ -120,8 +303,8 @@ class HotelManager:
                         Booking(id, room, arrival, departure, custom_service)
                     )
             else:
-                arrival = datetime.datetime.strptime(row["C"], "%d/%m/%Y").date()
-                departure = datetime.datetime.strptime(row["D"], "%d/%m/%Y").date()
+                arrival = _parse_ddmmyyyy(cells[_COL_ARRIVAL].text_content().strip())
+                departure = _parse_ddmmyyyy(cells[_COL_DEPARTURE].text_content().strip())
                 custom_service = (
                     1  # default custom_service, as it's not in the HTML file
                 )
@@ -129,12 +312,71 @@ class HotelManager:
                     Booking(id, room, arrival, departure, custom_service)
                 )
 
+        self._sync_arrays()
+
         # Load custom services
         self.load_custom_services(SERVICES_FILE_PATH)
 
         self.save_bookings()
         return "Bookings and custom services loaded successfully from HTML and JSON."
 
+    def load_bookings_from_csv(self, file_path):
+        """
+        Loads bookings from a CSV export and stores them in the bookings list.
+
+        This is a fast path for back-office exports already available as
+        CSV: pandas' C engine reads only the four needed columns, which
+        avoids HTML parsing entirely. Rules and custom services are
+        applied exactly as in load_bookings_from_html.
+
+        Parameters
+        ----------
+        file_path : str
+            The file path of the CSV file from where bookings are loaded.
+
+        Returns
+        -------
+        str
+            A message indicating whether the bookings and custom services were loaded successfully.
+        """
+
+        # Deferred: pandas costs a few hundred ms at import and is only
+        # needed for this path.
+        import pandas as pd
+
+        df = pd.read_csv(
+            file_path,
+            usecols=[_COL_ID, _COL_ARRIVAL, _COL_DEPARTURE, _COL_ROOM],
+            dtype=str,
+            engine="c",
+        )
+        self.bookings = []
+        rules = self.load_rules(RULES_FILE_PATH)
+        for id, arrival, departure, room in df.itertuples(index=False, name=None):
+            id = id.strip()
+            room = room.strip()
+            if id in rules:
+                for arrival, departure in rules[id]:
+                    self.bookings.append(Booking(id, room, arrival, departure, 1))
+            else:
+                self.bookings.append(
+                    Booking(
+                        id,
+                        room,
+                        _parse_ddmmyyyy(arrival.strip()),
+                        _parse_ddmmyyyy(departure.strip()),
+                        1,
+                    )
+                )
+
+        self._sync_arrays()
+
+        # Load custom services
+        self.load_custom_services(SERVICES_FILE_PATH)
+
+        self.save_bookings()
+        return "Bookings and custom services loaded successfully from CSV and JSON."
+
     def load_rules(self, file_path):
         """
         Loads custom rules for bookings from a JSON file.
@@ -150,18 +392,18 @@ class HotelManager:
             A dictionary containing the rules for the bookings.
         """
 
+        cache_key = (file_path, os.stat(file_path).st_mtime_ns)
+        if self._rules_cache and self._rules_cache[0] == cache_key:
+            return self._rules_cache[1]
+
         with open(file_path, "r", encoding="utf-8") as f:
             rules = json.load(f)
-        return {
-            key: [
-                (
-                    datetime.datetime.strptime(stay[0], "%d/%m/%Y").date(),
-                    datetime.datetime.strptime(stay[1], "%d/%m/%Y").date(),
-                )
-                for stay in stays
-            ]
+        rules = {
+            key: [(_parse_ddmmyyyy(stay[0]), _parse_ddmmyyyy(stay[1])) for stay in stays]
             for key, stays in rules.items()
         }
+        self._rules_cache = (cache_key, rules)
+        return rules
 
     def load_custom_services(self, file_path):
         """
@@ -181,12 +423,17 @@ class HotelManager:
                 A message indicating whether the custom services were loaded successfully.
         """
 
-        with open(file_path, "r", encoding="utf-8") as f:
-            custom_services = json.load(f)
+        cache_key = (file_path, os.stat(file_path).st_mtime_ns)
+        if self._services_cache and self._services_cache[0] == cache_key:
+            custom_services = self._services_cache[1]
+        else:
+            with open(file_path, "r", encoding="utf-8") as f:
+                custom_services = json.load(f)
+            self._services_cache = (cache_key, custom_services)
 
-        for booking in self.bookings:
-            if booking.id in custom_services:
-                booking.custom_service = custom_services[booking.id]
+        for booking_id, custom_service in custom_services.items():
+            for booking in self._by_id.get(booking_id, ()):
+                booking.custom_service = custom_service
 
         return "Custom services loaded successfully from JSON."
 
@@ -207,20 +454,28 @@ class HotelManager:
             A message indicating whether the custom service was updated successfully.
         """
 
-        for booking in self.bookings:
-            if booking.id == id:
+        matches = self._by_id.get(id)
+        if matches:
+            for booking in matches:
                 booking.custom_service = new_custom_service
-                self.save_bookings()
-                return f"Custom service for booking {id} updated successfully"
+            self._append_journal(
+                {"op": "update", "id": id, "custom_service": new_custom_service}
+            )
+            return f"Custom service for booking {id} updated successfully"
         return f"No booking found with ID {id}"
 
     def save_bookings(self):
         """
-        Saves the current bookings to a pickle file.
+        Saves the current bookings to a JSON file.
+
+        Writing the snapshot makes any journalled mutations redundant,
+        so the journal is truncated afterwards.
         """
 
         with open(self.save_file, "wb") as f:
-            pickle.dump(self.bookings, f)
+            f.write(orjson.dumps([booking.to_dict() for booking in self.bookings]))
+        if os.path.exists(self.journal_file):
+            os.remove(self.journal_file)
 
     def add_booking(self, room, arrival, departure, custom_service):
         """
@@ -247,42 +502,127 @@ class HotelManager:
         if room not in self.rooms:
             return "Invalid room name"
 
-        arrival = datetime.datetime.strptime(arrival, "%d/%m/%Y").date()
-        departure = datetime.datetime.strptime(departure, "%d/%m/%Y").date()
+        arrival = _parse_ddmmyyyy(arrival)
+        departure = _parse_ddmmyyyy(departure)
         if departure <= arrival:
             return "Departure date must be after arrival date"
 
-        for booking in self.bookings:
-            if booking.room == room and not (
-                arrival >= booking.departure or departure <= booking.arrival
-            ):
-                return "This room is already occupied during the given period"
+        occupied = (
+            (self._room_names == room)
+            & (arrival.toordinal() < self._departures_ord)
+            & (departure.toordinal() > self._arrivals_ord)
+        )
+        if occupied.any():
+            return "This room is already occupied during the given period"
 
         if custom_service.lower() != "n":
             custom_service = int(custom_service) if custom_service.isdigit() else 1
 
-        self.bookings.append(Booking(12345, room, arrival, departure, custom_service))
-        self.save_bookings()
+        booking = Booking(12345, room, arrival, departure, custom_service)
+        self.bookings.append(booking)
+        self._sync_arrays()
+        self._append_journal({"op": "add", "booking": booking.to_dict()})
         return "Booking added successfully\n"
 
-    def _get_padding(self, print_string: str) -> str:
+    def _compute_jobs_for_range(self, start, end):
         """
-        Gets the padding for a string to be printed.
+        Computes the jobs for every date in a range in a single sweep.
 
-        This is an internal method used to format strings for printing.
+        Each booking is visited once; its stay is clamped to
+        [`start`, `end`] and the job for every overlapping day is
+        recorded. This avoids rescanning all bookings once per day.
 
         Parameters
         ----------
-        print_string : str
-            The string for which the padding is to be calculated.
+        start : datetime.date
+            The first date of the range (inclusive).
+        end : datetime.date
+            The last date of the range (inclusive).
+
+        Returns
+        -------
+        dict
+            A mapping from each date to the set of (room, job code)
+            pairs due on it, where the code indexes into _JOB_NAMES.
+        """
+
+        jobs_by_date = defaultdict(set)
+        start_ord = start.toordinal()
+        end_ord = end.toordinal()
+        # Snapshot the list and arrays together so a reload on another
+        # thread (e.g. during the start-up warmup) can't swap them out
+        # from under the loop.
+        bookings = self.bookings
+        arrivals_ord = self._arrivals_ord
+        departures_ord = self._departures_ord
+        for i, booking in enumerate(bookings):
+            if booking.custom_service == "n":
+                continue
+            arrival_ord = int(arrivals_ord[i])
+            departure_ord = int(departures_ord[i])
+            lo = max(arrival_ord, start_ord)
+            hi = min(departure_ord, end_ord)
+            if lo > hi:
+                continue
+            custom_service = int(booking.custom_service)
+            stay_length = departure_ord - arrival_ord
+            for days in range(lo - arrival_ord, hi - arrival_ord + 1):
+                code = _classify_job(days, stay_length, custom_service)
+                if code < 0:
+                    continue
+                day = datetime.date.fromordinal(arrival_ord + days)
+                jobs_by_date[day].add((booking.room, code))
+        return jobs_by_date
+
+    def _warmup(self):
+        """
+        Primes the job-schedule machinery so the first button press is cheap.
+
+        Meant to be run in a background thread right after start-up: it
+        computes today's schedule once, which touches the per-booking
+        arrays and fills the padding cache for today's job lines. The
+        warmup is purely advisory, so if a reload races it the work is
+        abandoned and the first click is merely cold.
+        """
+
+        try:
+            today = datetime.date.today()
+            for room, code in self._compute_jobs_for_range(today, today).get(
+                today, ()
+            ):
+                _get_padding(f"* {room}: {_JOB_NAMES[code]}")
+        except Exception:
+            pass
+
+    def _format_jobs_for_day(self, day, jobs):
+        """
+        Formats one day's job box as a string.
+
+        Pure string building with no I/O, shared by print_todays_jobs
+        and print_week_jobs.
+
+        Parameters
+        ----------
+        day : datetime.date
+            The date heading the box.
+        jobs : iterable
+            The (room, job code) pairs due on the day.
 
         Returns
         -------
         str
-            A string of spaces that serves as padding for `print_string`, followed by an asterisk.
+            The formatted job box, without a trailing newline.
         """
 
-        return ((30 - len(print_string) - 1)) * " " + "*"
+        buffer = io.StringIO()
+        buffer.write(f"{'*' * 10}{day.strftime('%d/%m/%Y')}{'*' * 10}\n")
+        for room, code in sorted(jobs):
+            job = f"* {room}: {_JOB_NAMES[code]}"
+            buffer.write(job)
+            buffer.write(_get_padding(job))
+            buffer.write("\n")
+        buffer.write(_RULER)
+        return buffer.getvalue()
 
     def print_todays_jobs(self, today=None, to_file=False):
         """
@@ -304,44 +644,13 @@ class HotelManager:
         if today is None:
             today = datetime.date.today()
 
+        unique_jobs = self._compute_jobs_for_range(today, today).get(today, set())
+        output = self._format_jobs_for_day(today, unique_jobs)
         if to_file:
-            file = open("jobs.txt", "w", encoding="utf-8") #care, might not be utf-8 necessarily
-        else:
-            file = None
-
-        job_list = []
-        unique_jobs = set()
-        print_string = f"{'*' * 10}{today.strftime('%d/%m/%Y')}{'*' * 10}"
-        print(print_string, file=file)
-        job_list.append(print_string)
-        for booking in self.bookings:
-            if booking.arrival <= today <= booking.departure:
-                days = (today - booking.arrival).days
-                if booking.custom_service == "n":
-                    continue
-                elif today == booking.arrival:
-                    print_string = f"* {booking.room}: Γενικό"
-                elif today == booking.departure:
-                    print_string = f"* {booking.room}: Check-out"
-                elif days % (2 * int(booking.custom_service)) == int(
-                    booking.custom_service
-                ):
-                    print_string = f"* {booking.room}: Πετσέτες"
-                elif days % (2 * int(booking.custom_service)) == 0 and days != 0:
-                    print_string = f"* {booking.room}: Πετσέτες/Σεντόνια"
-                else:
-                    continue
-
-                unique_jobs.add(print_string)
-
-        for job in unique_jobs:
-            job_list.append(job + self._get_padding(job))
-            print(job + self._get_padding(job), file=file)
-
-        job_list.append("*" * 30)
-        print("*" * 30, file=file)
-
-        return "\n".join(job_list)
+            # care, might not be utf-8 necessarily
+            with open("jobs.txt", "w", encoding="utf-8") as f:
+                f.write(output)
+        return output
 
     def print_file(self, file_path):
         """
@@ -353,6 +662,14 @@ class HotelManager:
             The file path of the file to be printed.
         """
 
+        # Deferred: the pywin32 modules are heavy and only exist on
+        # Windows, so they are loaded on first use.
+        try:
+            import win32api
+            import win32print
+        except ImportError:
+            return "Printing requires pywin32 and only works on Windows."
+
         win32api.ShellExecute(
             0, "print", f"{file_path}", f'/d:"{win32print.GetDefaultPrinter()}"', ".", 0
         )
@@ -368,10 +685,12 @@ class HotelManager:
         """
 
         booking_list = ["All current bookings:"]
-        for booking in self.bookings:
-            booking_list.append(
-                f"Room: {booking.room}, Arrival: {booking.arrival}, Departure: {booking.departure}, Custom service: {booking.custom_service}"
+        booking_list.extend(
+            f"Room: {booking.room}, Arrival: {arrival}, Departure: {departure}, Custom service: {booking.custom_service}"
+            for booking, arrival, departure in zip(
+                self.bookings, self._arrivals_iso, self._departures_iso
             )
+        )
         return "\n".join(booking_list)
 
     def print_week_jobs(self):
@@ -386,9 +705,10 @@ class HotelManager:
 
         job_list = []
         today = datetime.date.today()
+        schedule = self._compute_jobs_for_range(today, today + datetime.timedelta(days=6))
         for i in range(7):
             day = today + datetime.timedelta(days=i)
-            job_list.append(self.print_todays_jobs(day))
+            job_list.append(self._format_jobs_for_day(day, schedule.get(day, ())))
         return "\n".join(job_list)
 
 
@@ -405,4 +725,4 @@ def run_manager():
     rooms = [
         f"R{num}" for num in [11, 12, 13, 14, 15, 16, 21, 22, 23, 24, 31, 32, 33, 34]
     ]
-    return HotelManager(rooms, "bookings.pkl")
+    return HotelManager(rooms, "bookings.json")
@@ -4,6 +4,7 @@ The GUI class provides a graphical user interface for interacting with the Hotel
 The main function initializes the Hotel Manager and creates an instance of the GUI class.
 """
 
+import threading
 import tkinter as tk
 from tkinter import filedialog, simpledialog
 from hotel_manager import run_manager
@@ -44,6 +45,11 @@ class GUI:
                                      command=self.load_bookings_from_html)
         self.load_button.pack(side="left")
 
+        self.load_csv_button = tk.Button(self.frame,
+                                         text="Load bookings from CSV",
+                                         command=self.load_bookings_from_csv)
+        self.load_csv_button.pack(side="left")
+
         self.print_and_output_button = tk.Button(self.frame,
                                                  text="Print and physically output today's jobs",
                                                  command=self.print_and_output_todays_jobs)
@@ -86,6 +92,10 @@ class GUI:
         file_path = filedialog.askopenfilename()
         self.manager.load_bookings_from_html(file_path)
 
+    def load_bookings_from_csv(self):
+        file_path = filedialog.askopenfilename()
+        self.manager.load_bookings_from_csv(file_path)
+
     def print_and_output_todays_jobs(self):
         self.manager.print_todays_jobs(to_file=True)
         self.manager.print_file("jobs.txt")
@@ -132,6 +142,9 @@ def main():
     Initializes the run manager, creates the GUI, and starts the main event loop.
     """
     manager = run_manager()
+    # Warm the schedule machinery off-thread so the window opens
+    # immediately and the first button press doesn't pay for it.
+    threading.Thread(target=manager._warmup, daemon=True).start()
     root = tk.Tk()
     gui = GUI(root, manager)
     root.mainloop()